@@ -7,29 +7,35 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
-from typing import Iterable, Tuple
+from typing import Optional, Sequence
 
 from x402_payments import ConfigError, create_payment_client, load_payment_config
-
-
-def _override(value: str) -> Tuple[str, str]:
-    if "=" not in value:
-        raise argparse.ArgumentTypeError("Overrides must look like KEY=VALUE")
-    key, val = value.split("=", 1)
-    key = key.strip()
-    if not key:
-        raise argparse.ArgumentTypeError("Override key must not be empty")
-    return key, val
-
-
-def _build_overrides(pairs: Iterable[Tuple[str, str]]) -> dict[str, str]:
-    overrides: dict[str, str] = {}
-    for key, value in pairs:
-        overrides[key] = value
-    return overrides
-
-
-def parse_args() -> argparse.Namespace:
+from x402_payments._cli_utils import env_override
+
+
+_BASE_OPTIONS = frozenset({"--env-file", "--set", "--log-level", "--verify-only"})
+
+_OVERRIDE_FIELDS = (
+    "payer_private_key",
+    "payer_address",
+    "receiver_address",
+    "facilitator_url",
+    "amount",
+    "timeout_seconds",
+    "backdate_seconds",
+    "resource",
+    "description",
+    "mime_type",
+    "token_decimals",
+    "asset_address",
+    "token_name",
+    "token_version",
+    "chain_id",
+    "network",
+)
+
+
+def _build_base_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Send an x402 payment using the SDK API")
     parser.add_argument(
         "--env-file",
@@ -39,7 +45,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--set",
         action="append",
-        type=_override,
+        type=env_override,
         metavar="KEY=VALUE",
         default=None,
         help="Override an environment variable without editing the .env file",
@@ -54,6 +60,10 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Stop after facilitator verification (no on-chain settlement)",
     )
+    return parser
+
+
+def _add_override_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--payer-private-key",
         help="Provide the payer's private key without relying on environment data",
@@ -122,29 +132,43 @@ def parse_args() -> argparse.Namespace:
         "--network",
         help="Override the short network identifier (default: bsc)",
     )
-    return parser.parse_args()
+
+
+def _needs_override_parser(argv: Sequence[str]) -> bool:
+    """
+    Return ``True`` when ``argv`` uses any option beyond the base set.
+
+    Help requests, abbreviations, and the per-field overrides all need the
+    full parser; plain runs only pay for the handful of base options.
+    """
+    for token in argv:
+        if token == "--":
+            break
+        if token.startswith("-") and token.split("=", 1)[0] not in _BASE_OPTIONS:
+            return True
+    return False
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    argv = sys.argv[1:] if argv is None else argv
+    parser = _build_base_parser()
+    if _needs_override_parser(argv):
+        _add_override_arguments(parser)
+        return parser.parse_args(argv)
+
+    args = parser.parse_args(argv)
+    for field_name in _OVERRIDE_FIELDS:
+        setattr(args, field_name, None)
+    return args
 
 
 def _collect_parameter_kwargs(args: argparse.Namespace) -> dict[str, object]:
-    possible_values = {
-        "payer_private_key": args.payer_private_key,
-        "payer_address": args.payer_address,
-        "receiver_address": args.receiver_address,
-        "facilitator_url": args.facilitator_url,
-        "amount": args.amount,
-        "timeout_seconds": args.timeout_seconds,
-        "backdate_seconds": args.backdate_seconds,
-        "resource": args.resource,
-        "description": args.description,
-        "mime_type": args.mime_type,
-        "token_decimals": args.token_decimals,
-        "asset_address": args.asset_address,
-        "token_name": args.token_name,
-        "token_version": args.token_version,
-        "chain_id": args.chain_id,
-        "network": args.network,
+    values = vars(args)
+    return {
+        field_name: values[field_name]
+        for field_name in _OVERRIDE_FIELDS
+        if values[field_name] is not None
     }
-    return {key: value for key, value in possible_values.items() if value is not None}
 
 
 def main() -> int:
@@ -154,7 +178,7 @@ def main() -> int:
         format="%(asctime)s %(levelname)s %(message)s",
     )
 
-    overrides = _build_overrides(args.set or ())
+    overrides = dict(args.set or ())
     parameter_kwargs = _collect_parameter_kwargs(args)
 
     try:
@@ -170,13 +194,7 @@ def main() -> int:
     client = create_payment_client(config=config)
     logging.info("Preparing payment requirements for %s", config.facilitator_url)
 
-    requirements = client.payment_requirements()
-    payload = client.build_payment_payload()
-    request_body = {
-        "x402Version": 1,
-        "paymentRequirements": requirements,
-        "paymentPayload": payload,
-    }
+    request_body = client.build_payment_request()
 
     try:
         verify_response = client.verify(request_body)
@@ -5,7 +5,7 @@ The module intentionally re-exports the most useful pieces for integrators so
 they can ``from x402_payments import ...`` without navigating the package.
 """
 
-from .api import create_payment_client, send_payment
+from .api import create_payment_client, invalidate_config_cache, send_payment
 from .core import (
     ConfigError,
     PaymentClient,
@@ -17,6 +17,7 @@ from .core import (
     build_environment,
     build_payment_payload,
     build_payment_request,
+    clear_env_cache,
     load_env_file,
     load_payment_config,
     settle_payment,
@@ -34,9 +35,11 @@ __all__ = (
     "build_environment",
     "build_payment_payload",
     "build_payment_request",
+    "clear_env_cache",
     "load_env_file",
     "load_payment_config",
     "create_payment_client",
+    "invalidate_config_cache",
     "settle_payment",
     "verify_payment",
     "send_payment",
@@ -0,0 +1,19 @@
+"""
+Argument helpers shared by the CLI and the bundled example script.
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Tuple
+
+
+def env_override(value: str) -> Tuple[str, str]:
+    """Parse a ``KEY=VALUE`` override passed via ``--set``."""
+    key, sep, val = value.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError("Overrides must look like KEY=VALUE")
+    key = key.strip()
+    if not key:
+        raise argparse.ArgumentTypeError("Override key must not be empty")
+    return key, val
@@ -4,10 +4,8 @@ Public, high-level helpers for interacting with the x402 payment facilitator.
 
 from __future__ import annotations
 
-from decimal import Decimal
-from typing import Mapping, Optional
-
-import requests
+import dataclasses
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 from .core.client import (
     PaymentClient,
@@ -20,15 +18,24 @@ from .core.config import (
     ConfigError,
     PaymentConfig,
     PaymentParameters,
+    _config_from_values,
     load_payment_config,
 )
-from .core.environment import PaymentEnvironment, build_environment, load_env_file
+from .core.environment import (
+    PaymentEnvironment,
+    build_environment,
+    clear_env_cache,
+    load_env_file,
+)
 from .core.payloads import (
     build_authorization_payload,
     build_payment_payload,
     build_payment_request,
 )
 
+if TYPE_CHECKING:
+    import requests
+
 __all__ = [
     "ConfigError",
     "PaymentClient",
@@ -41,6 +48,7 @@ __all__ = [
     "build_payment_payload",
     "build_payment_request",
     "create_payment_client",
+    "invalidate_config_cache",
     "load_env_file",
     "load_payment_config",
     "send_payment",
@@ -48,6 +56,66 @@ __all__ = [
     "verify_payment",
 ]
 
+_CONFIG_FIELDS = frozenset(field.name for field in dataclasses.fields(PaymentParameters))
+
+
+def _resolve_config(
+    caller: str,
+    config: Optional[PaymentConfig],
+    *,
+    env_file: Optional[str],
+    overrides: Optional[Mapping[str, str]],
+    base: Optional[Mapping[str, str]],
+    parameters: Optional[PaymentParameters],
+    parameter_kwargs: Mapping[str, Any],
+) -> PaymentConfig:
+    """
+    Return ``config`` or load one from the remaining arguments.
+    """
+    if parameter_kwargs:
+        unknown = parameter_kwargs.keys() - _CONFIG_FIELDS
+        if unknown:
+            raise TypeError(
+                f"{caller}() got an unexpected keyword argument '{sorted(unknown)[0]}'"
+            )
+
+    if config is not None:
+        if (
+            overrides
+            or base
+            or parameters is not None
+            or (
+                parameter_kwargs
+                and any(value is not None for value in parameter_kwargs.values())
+            )
+        ):
+            raise ValueError(
+                "Provide either a pre-built PaymentConfig or individual parameters, not both."
+            )
+        return config
+
+    # Repeated loads stay cheap: ``.env`` files are re-read only when they
+    # change, and identical settings reuse the already validated config.
+    return load_payment_config(
+        env_file=env_file,
+        overrides=overrides,
+        base=base,
+        parameters=parameters,
+        **parameter_kwargs,
+    )
+
+
+def invalidate_config_cache() -> None:
+    """
+    Drop every cached ``.env`` file and every memoized :class:`PaymentConfig`.
+
+    Edited ``.env`` files are picked up on their own, so this is mainly for
+    releasing configurations, private keys included, that the process no
+    longer needs, e.g. after a key rotation.
+    """
+    clear_env_cache()
+    _config_from_values.cache_clear()
+
 
 def create_payment_client(
     *,
@@ -57,79 +125,25 @@ def create_payment_client(
     overrides: Optional[Mapping[str, str]] = None,
     base: Optional[Mapping[str, str]] = None,
     parameters: Optional[PaymentParameters] = None,
-    payer_private_key: Optional[str] = None,
-    payer_address: Optional[str] = None,
-    receiver_address: Optional[str] = None,
-    facilitator_url: Optional[str] = None,
-    amount: Optional[Decimal | str | float | int] = None,
-    timeout_seconds: Optional[int | str] = None,
-    backdate_seconds: Optional[int | str] = None,
-    resource: Optional[str] = None,
-    description: Optional[str] = None,
-    mime_type: Optional[str] = None,
-    token_decimals: Optional[int | str] = None,
-    asset_address: Optional[str] = None,
-    token_name: Optional[str] = None,
-    token_version: Optional[str] = None,
-    chain_id: Optional[int | str] = None,
-    network: Optional[str] = None,
+    **parameter_kwargs: Any,
 ) -> PaymentClient:
     """
     Construct a :class:`PaymentClient`.
 
     Callers can either supply a ready-made :class:`PaymentConfig` or let the
-    helper assemble one from environment data.
+    helper assemble one from environment data. Additional keyword arguments
+    are the :class:`PaymentParameters` fields accepted by
+    :func:`load_payment_config`.
     """
-    if config is not None:
-        extras = (
-            overrides,
-            base,
-            parameters,
-            payer_private_key,
-            payer_address,
-            receiver_address,
-            facilitator_url,
-            amount,
-            timeout_seconds,
-            backdate_seconds,
-            resource,
-            description,
-            mime_type,
-            token_decimals,
-            asset_address,
-            token_name,
-            token_version,
-            chain_id,
-            network,
-        )
-        if any(item is not None and item != {} for item in extras):
-            raise ValueError(
-                "Provide either a pre-built PaymentConfig or individual parameters, not both."
-            )
-        cfg = config
-    else:
-        cfg = load_payment_config(
-            env_file=env_file,
-            overrides=overrides,
-            base=base,
-            parameters=parameters,
-            payer_private_key=payer_private_key,
-            payer_address=payer_address,
-            receiver_address=receiver_address,
-            facilitator_url=facilitator_url,
-            amount=amount,
-            timeout_seconds=timeout_seconds,
-            backdate_seconds=backdate_seconds,
-            resource=resource,
-            description=description,
-            mime_type=mime_type,
-            token_decimals=token_decimals,
-            asset_address=asset_address,
-            token_name=token_name,
-            token_version=token_version,
-            chain_id=chain_id,
-            network=network,
-        )
+    cfg = _resolve_config(
+        "create_payment_client",
+        config,
+        env_file=env_file,
+        overrides=overrides,
+        base=base,
+        parameters=parameters,
+        parameter_kwargs=parameter_kwargs,
+    )
     return PaymentClient(cfg, session=session)
 
 
@@ -142,74 +156,21 @@ def send_payment(
     base: Optional[Mapping[str, str]] = None,
     verify_only: bool = False,
     parameters: Optional[PaymentParameters] = None,
-    payer_private_key: Optional[str] = None,
-    payer_address: Optional[str] = None,
-    receiver_address: Optional[str] = None,
-    facilitator_url: Optional[str] = None,
-    amount: Optional[Decimal | str | float | int] = None,
-    timeout_seconds: Optional[int | str] = None,
-    backdate_seconds: Optional[int | str] = None,
-    resource: Optional[str] = None,
-    description: Optional[str] = None,
-    mime_type: Optional[str] = None,
-    token_decimals: Optional[int | str] = None,
-    asset_address: Optional[str] = None,
-    token_name: Optional[str] = None,
-    token_version: Optional[str] = None,
-    chain_id: Optional[int | str] = None,
-    network: Optional[str] = None,
+    **parameter_kwargs: Any,
 ) -> SettlementResult:
     """
     High-level convenience wrapper that handles verify + settle.
+
+    Keyword arguments beyond the ones listed are the :class:`PaymentParameters`
+    fields accepted by :func:`load_payment_config`.
     """
-    if config is not None:
-        extras = (
-            overrides,
-            base,
-            parameters,
-            payer_private_key,
-            payer_address,
-            receiver_address,
-            facilitator_url,
-            amount,
-            timeout_seconds,
-            backdate_seconds,
-            resource,
-            description,
-            mime_type,
-            token_decimals,
-            asset_address,
-            token_name,
-            token_version,
-            chain_id,
-            network,
-        )
-        if any(item is not None and item != {} for item in extras):
-            raise ValueError(
-                "Provide either a pre-built PaymentConfig or individual parameters, not both."
-            )
-        cfg = config
-    else:
-        cfg = load_payment_config(
-            env_file=env_file,
-            overrides=overrides,
-            base=base,
-            parameters=parameters,
-            payer_private_key=payer_private_key,
-            payer_address=payer_address,
-            receiver_address=receiver_address,
-            facilitator_url=facilitator_url,
-            amount=amount,
-            timeout_seconds=timeout_seconds,
-            backdate_seconds=backdate_seconds,
-            resource=resource,
-            description=description,
-            mime_type=mime_type,
-            token_decimals=token_decimals,
-            asset_address=asset_address,
-            token_name=token_name,
-            token_version=token_version,
-            chain_id=chain_id,
-            network=network,
-        )
+    cfg = _resolve_config(
+        "send_payment",
+        config,
+        env_file=env_file,
+        overrides=overrides,
+        base=base,
+        parameters=parameters,
+        parameter_kwargs=parameter_kwargs,
+    )
     return _send_payment(cfg, session=session, verify_only=verify_only)
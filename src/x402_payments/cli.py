@@ -5,11 +5,11 @@ Command-line interface for exercising the x402 payment APIs.
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
-from typing import Iterable, Sequence, Tuple
-
-import requests
+from typing import Sequence
 
+from ._cli_utils import env_override
 from .api import ConfigError, SettlementResult, create_payment_client, load_payment_config
 
 
@@ -20,23 +20,7 @@ def _configure_logging(level: str) -> None:
     )
 
 
-def _env_override(value: str) -> Tuple[str, str]:
-    if "=" not in value:
-        raise argparse.ArgumentTypeError("Overrides must look like KEY=VALUE")
-    key, val = value.split("=", 1)
-    key = key.strip()
-    if not key:
-        raise argparse.ArgumentTypeError("Override key must not be empty")
-    return key, val
-
-
-def _collect_overrides(pairs: Iterable[Tuple[str, str]]) -> dict[str, str]:
-    overrides: dict[str, str] = {}
-    for key, value in pairs:
-        overrides[key] = value
-    return overrides
-
-
+@functools.lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="x402-payments",
@@ -50,7 +34,7 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--set",
         action="append",
-        type=_env_override,
+        type=env_override,
         metavar="KEY=VALUE",
         default=None,
         help="Override an environment variable without editing the .env file",
@@ -73,7 +57,7 @@ def run_cli(argv: Sequence[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     _configure_logging(args.log_level)
-    overrides = _collect_overrides(args.set or ())
+    overrides = dict(args.set or ())
 
     try:
         config = load_payment_config(env_file=args.env_file, overrides=overrides)
@@ -81,7 +65,7 @@ def run_cli(argv: Sequence[str] | None = None) -> int:
         logging.error("Invalid configuration: %s", exc)
         return 1
 
-    client = create_payment_client(config=config, session=requests.Session())
+    client = create_payment_client(config=config)
     request_body = client.build_request()
 
     try:
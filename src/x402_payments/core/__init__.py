@@ -15,7 +15,12 @@ from .config import (
     PaymentParameters,
     load_payment_config,
 )
-from .environment import PaymentEnvironment, build_environment, load_env_file
+from .environment import (
+    PaymentEnvironment,
+    build_environment,
+    clear_env_cache,
+    load_env_file,
+)
 from .payloads import (
     build_authorization_payload,
     build_payment_payload,
@@ -33,6 +38,7 @@ __all__ = [
     "build_environment",
     "build_payment_payload",
     "build_payment_request",
+    "clear_env_cache",
     "load_env_file",
     "load_payment_config",
     "send_payment",
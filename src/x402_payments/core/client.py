@@ -4,19 +4,24 @@ HTTP client helpers for the x402 facilitator.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
-
-import requests
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple
 
 from .config import PaymentConfig
-from .payloads import (
-    build_authorization_payload,
-    build_payment_payload,
-    build_payment_request,
-)
+from .payloads import build_authorization_payload, build_payment_payload
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    import requests
+    import urllib3
 
 __all__ = [
     "PaymentClient",
@@ -26,32 +31,176 @@ __all__ = [
     "send_payment",
 ]
 
+logger = logging.getLogger(__name__)
+
+_REQUEST_TIMEOUT_SECONDS = 30.0
+_ERROR_BODY_LIMIT = 500
+_POOL_NUM_HOSTS = 16
+_POOL_MAX_CONNECTIONS_PER_HOST = 64
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_MAX_REDIRECTS = 3
+
+# Connection pools keyed by the proxy URL they go through (``None`` = direct)
+# and the CA bundle they verify against.
+_POOLS: Dict[Tuple[Optional[str], str], urllib3.PoolManager] = {}
+
+
+def _proxy_for(scheme: str, host: str) -> Optional[str]:
+    # Proxy settings come from the standard ``*_proxy`` / ``no_proxy``
+    # variables and are re-read on every request, like ``requests``.
+    from urllib.request import getproxies, proxy_bypass
+
+    proxy = getproxies().get(scheme)
+    if proxy is None or proxy_bypass(host):
+        return None
+    return proxy
+
+
+def _ca_bundle() -> str:
+    # Same lookup order as ``requests``: an explicitly configured bundle
+    # (e.g. a corporate CA) wins over the one shipped with certifi.
+    bundle = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE")
+    if bundle:
+        return bundle
+    import certifi
+
+    return certifi.where()
+
+
+def _get_pool(url: str) -> urllib3.PoolManager:
+    """
+    Return the process-wide connection pool used when no session is supplied.
+
+    The pool is shared by every :class:`PaymentClient` created without a
+    session, so the TCP/TLS connection to the facilitator stays alive across
+    clients and between ``/verify`` and ``/settle`` calls. Like ``requests``,
+    it honours the proxy and CA bundle environment variables and follows a
+    few redirects.
+    """
+    from urllib.parse import unquote, urlsplit
+
+    parts = urlsplit(url)
+    proxy = _proxy_for(parts.scheme, parts.hostname or "")
+    ca_bundle = _ca_bundle()
+    pool = _POOLS.get((proxy, ca_bundle))
+    if pool is None:
+        import urllib3
+
+        options: Dict[str, Any] = {
+            "num_pools": _POOL_NUM_HOSTS,
+            "maxsize": _POOL_MAX_CONNECTIONS_PER_HOST,
+            "retries": urllib3.Retry(
+                total=None,
+                connect=0,
+                read=0,
+                status=0,
+                other=0,
+                redirect=_MAX_REDIRECTS,
+            ),
+        }
+        if os.path.isdir(ca_bundle):
+            options["ca_cert_dir"] = ca_bundle
+        else:
+            options["ca_certs"] = ca_bundle
+
+        if proxy is None:
+            pool = urllib3.PoolManager(**options)
+        else:
+            proxy_parts = urlsplit(proxy)
+            if proxy_parts.username is not None:
+                # urllib3 does not read credentials from the proxy URL itself.
+                username = unquote(proxy_parts.username)
+                password = unquote(proxy_parts.password or "")
+                options["proxy_headers"] = urllib3.make_headers(
+                    proxy_basic_auth=f"{username}:{password}"
+                )
+            pool = urllib3.ProxyManager(proxy, **options)
+        _POOLS[(proxy, ca_bundle)] = pool
+    return pool
+
+
+def _dumps(body: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(body)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(body).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _excerpt(data: bytes) -> str:
+    return data[:_ERROR_BODY_LIMIT].decode("utf-8", "replace")
+
+
+def _is_json(headers: Mapping[str, str]) -> bool:
+    # A missing header is given the benefit of the doubt; an explicit
+    # non-JSON type (typically an HTML error page) is rejected without parsing.
+    content_type = headers.get("content-type")
+    return content_type is None or "json" in content_type.lower()
+
+
+def _post_json(
+    session: Optional[requests.Session],
+    url: str,
+    body: Dict[str, Any],
+) -> Dict[str, Any]:
+    status: int
+    headers: Mapping[str, str]
+    data: bytes
+    if session is not None:
+        response = session.post(url, json=body, timeout=_REQUEST_TIMEOUT_SECONDS)
+        status, headers, data = response.status_code, response.headers, response.content
+    else:
+        pooled = _get_pool(url).request(
+            "POST",
+            url,
+            body=_dumps(body),
+            headers=_JSON_HEADERS,
+            timeout=_REQUEST_TIMEOUT_SECONDS,
+        )
+        status, headers, data = pooled.status, pooled.headers, pooled.data
 
-def _post_json(session: requests.Session, url: str, body: Dict[str, Any]) -> Dict[str, Any]:
-    response = session.post(url, json=body, timeout=30)
-    if response.status_code >= 400:
+    # Bodies are parsed straight from bytes; only the (truncated) error
+    # excerpt is ever decoded to text.
+    if status >= 400:
+        raise RuntimeError(f"Facilitator responded with {status}: {_excerpt(data)}")
+    if not _is_json(headers):
         raise RuntimeError(
-            f"Facilitator responded with {response.status_code}: {response.text}"
+            f"Non-JSON response from facilitator at {url}: {_excerpt(data)}"
         )
     try:
-        return response.json()
-    except json.JSONDecodeError as exc:
+        return _loads(data)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise RuntimeError(
-            f"Failed to parse JSON from facilitator at {url}: {response.text}"
+            f"Failed to parse JSON from facilitator at {url}: {_excerpt(data)}"
         ) from exc
 
 
+def _verify_at(
+    session: Optional[requests.Session],
+    verify_url: str,
+    body: Dict[str, Any],
+) -> Dict[str, Any]:
+    logger.info("Submitting payment for verification to %s", verify_url)
+    return _post_json(session, verify_url, body)
+
+
 def verify_payment(
-    session: requests.Session,
+    session: Optional[requests.Session],
     config: PaymentConfig,
     body: Dict[str, Any],
 ) -> Dict[str, Any]:
-    verify_url = f"{config.facilitator_url}/verify"
-    logging.info("Submitting payment for verification to %s", verify_url)
-    return _post_json(session, verify_url, body)
+    return _verify_at(session, f"{config.facilitator_url}/verify", body)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SettlementResult:
     success: bool
     network: Optional[str]
@@ -68,20 +217,32 @@ class SettlementResult:
         )
 
 
-def settle_payment(
-    session: requests.Session,
-    config: PaymentConfig,
+def _settle_at(
+    session: Optional[requests.Session],
+    settle_url: str,
     body: Dict[str, Any],
 ) -> SettlementResult:
-    settle_url = f"{config.facilitator_url}/settle"
-    logging.info("Submitting payment for settlement to %s", settle_url)
+    logger.info("Submitting payment for settlement to %s", settle_url)
     payload = _post_json(session, settle_url, body)
     return SettlementResult.from_response(payload)
 
 
+def settle_payment(
+    session: Optional[requests.Session],
+    config: PaymentConfig,
+    body: Dict[str, Any],
+) -> SettlementResult:
+    return _settle_at(session, f"{config.facilitator_url}/settle", body)
+
+
 class PaymentClient:
     """
     Thin convenience wrapper around the facilitator endpoints.
+
+    Without a ``session`` the client uses a connection pool shared across the
+    process. Any object with a ``requests``-style ``post`` method may be passed
+    instead, e.g. ``httpx.Client(http2=True)`` to multiplex both calls over a
+    single HTTP/2 connection.
     """
 
     def __init__(
@@ -91,7 +252,13 @@ class PaymentClient:
         session: Optional[requests.Session] = None,
     ) -> None:
         self.config = config
-        self.session = session or requests.Session()
+        # ``None`` routes requests through the shared urllib3 pool.
+        self.session = session
+        self._verify_url = f"{config.facilitator_url}/verify"
+        self._settle_url = f"{config.facilitator_url}/settle"
+        # Payloads for an explicit ``(now, nonce)`` pair are deterministic, so
+        # repeated builds skip the EIP-712 hashing and signing.
+        self._pinned_payloads = functools.lru_cache(maxsize=16)(self._sign_payload)
 
     def payment_requirements(self) -> Dict[str, Any]:
         """
@@ -99,6 +266,9 @@ class PaymentClient:
         """
         return self.config.payment_requirements()
 
+    def _sign_payload(self, now: Optional[int], nonce: Optional[bytes]) -> Dict[str, Any]:
+        return build_payment_payload(self.config, now=now, nonce=nonce)
+
     def build_authorization_payload(
         self,
         *,
@@ -113,7 +283,15 @@ class PaymentClient:
         now: Optional[int] = None,
         nonce: Optional[bytes] = None,
     ) -> Dict[str, Any]:
-        return build_payment_payload(self.config, now=now, nonce=nonce)
+        if now is None or nonce is None:
+            return self._sign_payload(now, nonce)
+        payload = self._pinned_payloads(now, bytes(nonce))
+        # Hand out a copy so callers cannot alter the cached entry.
+        inner = payload["payload"]
+        return {
+            **payload,
+            "payload": {**inner, "authorization": dict(inner["authorization"])},
+        }
 
     def build_payment_request(
         self,
@@ -121,7 +299,11 @@ class PaymentClient:
         now: Optional[int] = None,
         nonce: Optional[bytes] = None,
     ) -> Dict[str, Any]:
-        return build_payment_request(self.config, now=now, nonce=nonce)
+        return {
+            "x402Version": 1,
+            "paymentPayload": self.build_payment_payload(now=now, nonce=nonce),
+            "paymentRequirements": self.payment_requirements(),
+        }
 
     def build_request(
         self,
@@ -135,10 +317,10 @@ class PaymentClient:
         return self.build_payment_request(now=now, nonce=nonce)
 
     def verify(self, body: Dict[str, Any]) -> Dict[str, Any]:
-        return verify_payment(self.session, self.config, body)
+        return _verify_at(self.session, self._verify_url, body)
 
     def settle(self, body: Dict[str, Any]) -> SettlementResult:
-        return settle_payment(self.session, self.config, body)
+        return _settle_at(self.session, self._settle_url, body)
 
     def send(self, *, verify_only: bool = False) -> SettlementResult:
         request_body = self.build_payment_request()
@@ -156,6 +338,46 @@ class PaymentClient:
 
         return self.settle(request_body)
 
+    def send_pipelined(self) -> SettlementResult:
+        """
+        Submit ``/verify`` and ``/settle`` concurrently instead of back to back.
+
+        This saves one round-trip to the facilitator, which re-validates the
+        payload before settling. Both responses are always awaited: a
+        successful settlement is returned even if ``/verify`` rejected the
+        payload or failed, since the funds have already moved and retrying
+        would pay twice. Otherwise a rejected payload raises ``RuntimeError``,
+        just like :meth:`send`.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        request_body = self.build_payment_request()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            verify_future = executor.submit(self.verify, request_body)
+            settle_future = executor.submit(self.settle, request_body)
+            settle_error = settle_future.exception()
+            verify_error = verify_future.exception()
+
+        settlement = None if settle_error is not None else settle_future.result()
+        verify_response = None if verify_error is not None else verify_future.result()
+        verified = verify_response is not None and bool(verify_response.get("isValid"))
+
+        if settlement is not None and settlement.success:
+            if not verified:
+                logger.warning(
+                    "Payment settled in %s although verification did not pass: %s",
+                    settlement.transaction,
+                    verify_error if verify_error is not None else verify_response,
+                )
+            return settlement
+        if verify_error is not None:
+            raise verify_error
+        if not verified:
+            raise RuntimeError(f"Payment rejected: {verify_response}")
+        if settle_error is not None:
+            raise settle_error
+        return settle_future.result()
+
 
 def send_payment(
     config: PaymentConfig,
@@ -4,15 +4,17 @@ Configuration objects and helpers for x402 payments.
 
 from __future__ import annotations
 
+import functools
+import operator
 import os
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
-from typing import Any, Dict, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Tuple
 
-from eth_account import Account
-from eth_utils import is_hex_address, to_checksum_address
+from .environment import PaymentEnvironment, _chain_environment
 
-from .environment import PaymentEnvironment, build_environment
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
 
 __all__ = [
     "ConfigError",
@@ -39,6 +41,20 @@ _PARAMETER_TO_ENV_KEY = {
     "chain_id": "X402_PAYMENT_CHAIN_ID",
     "network": "X402_PAYMENT_NETWORK",
 }
+_CONFIG_ENV_KEYS = tuple(_PARAMETER_TO_ENV_KEY.values())
+# Reads every parameter field in one call, in ``_CONFIG_ENV_KEYS`` order.
+_PARAMETER_GETTER = operator.attrgetter(*_PARAMETER_TO_ENV_KEY)
+
+# Covers every exponent a uint256 amount can need.
+_POW10 = tuple(10**exponent for exponent in range(78))
+
+# XUSD on BSC, already in EIP-55 checksum form.
+_DEFAULT_ASSET_ADDRESS = "0xf3A3E4D9c163251124229Da6DC9C98D889647804"
+
+# keccak256("EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)")
+_EIP712_DOMAIN_TYPEHASH = bytes.fromhex(
+    "8b73c3c69bb8fe3d512ecc4cf759cc79239f7b179b0ffacaa9a75d522b39400f"
+)
 
 
 def _stringify(value: Any) -> str:
@@ -47,7 +63,7 @@ def _stringify(value: Any) -> str:
     return str(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PaymentParameters:
     """
     Explicit parameter bundle for constructing :class:`PaymentConfig`.
@@ -74,19 +90,20 @@ class PaymentParameters:
     network: Optional[str] = None
 
     def as_overrides(self) -> Dict[str, str]:
-        overrides: Dict[str, str] = {}
-        for field_name, env_key in _PARAMETER_TO_ENV_KEY.items():
-            value = getattr(self, field_name)
-            if value is None:
-                continue
-            overrides[env_key] = _stringify(value)
-        return overrides
+        return {
+            env_key: _stringify(value)
+            for env_key, value in zip(_CONFIG_ENV_KEYS, _PARAMETER_GETTER(self))
+            if value is not None
+        }
 
 
 def _collect_parameter_overrides(
     parameters: Optional[PaymentParameters],
     explicit: Mapping[str, Any],
 ) -> Dict[str, str]:
+    if parameters is None and all(value is None for value in explicit.values()):
+        return {}
+
     overrides: Dict[str, str] = {}
     if parameters is not None:
         overrides.update(parameters.as_overrides())
@@ -123,13 +140,46 @@ def _normalize_address(raw_address: str, field_name: str) -> str:
         raise ConfigError(f"{field_name} must not be empty")
     if not value.startswith("0x"):
         value = "0x" + value
+    from eth_utils import is_hex_address
+
     if not is_hex_address(value):
         raise ConfigError(f"{field_name} is not a valid EVM address")
 
-    return to_checksum_address(value)
+    return _checksum_cached(value.lower())
+
+
+@functools.lru_cache(maxsize=256)
+def _checksum_cached(lower_hex: str) -> str:
+    # EIP-55 checksumming hashes the address; configs are rebuilt with the
+    # same handful of addresses over and over.
+    from eth_utils import to_checksum_address
+
+    return to_checksum_address(lower_hex)
+
+
+def _address_word(address: str) -> bytes:
+    # Configs can be constructed directly, so the address is decoded through
+    # eth_utils rather than trusted to be a 0x-prefixed 20-byte value; a bad
+    # address must not be signed over as a different account.
+    from eth_utils import to_canonical_address
+
+    return to_canonical_address(address).rjust(32, b"\x00")
 
 
 def _to_base_units(amount: Decimal, decimals: int) -> int:
+    sign, digits, exponent = amount.as_tuple()
+    # Fast path: a finite amount with no more fractional digits than the
+    # token supports scales exactly with integer arithmetic.
+    if isinstance(exponent, int) and 0 <= -exponent <= decimals:
+        shift = decimals + exponent
+        factor = _POW10[shift] if shift < len(_POW10) else 10**shift
+        as_int = int("".join(map(str, digits))) * factor
+        if sign:
+            as_int = -as_int
+        if as_int <= 0:
+            raise ConfigError("Payment amount must be greater than zero")
+        return as_int
+
     scaled = amount * (Decimal(10) ** decimals)
     try:
         integral = scaled.to_integral_exact()
@@ -149,8 +199,26 @@ def _to_base_units(amount: Decimal, decimals: int) -> int:
     return as_int
 
 
-@dataclass(frozen=True)
-class PaymentConfig:
+class _ConfigCache:
+    """
+    Slots for values :class:`PaymentConfig` derives lazily from its fields.
+
+    Keeping them off the dataclass leaves ``fields()``, ``asdict()`` and
+    ``replace()`` unaware of the caches. A slot may be unset, e.g. after
+    ``replace()`` or unpickling, so reads go through ``getattr`` with a
+    default.
+    """
+
+    __slots__ = ("_requirements", "_signer", "_domain_separator", "_party_words")
+
+    _requirements: Optional[Dict[str, Any]]
+    _signer: Optional[LocalAccount]
+    _domain_separator: Optional[bytes]
+    _party_words: Optional[bytes]
+
+
+@dataclass(frozen=True, slots=True)
+class PaymentConfig(_ConfigCache):
     facilitator_url: str
     payer_private_key: str
     payer_address: str
@@ -168,11 +236,63 @@ class PaymentConfig:
     token_name: str = "Wrapped USDC"
     token_version: str = "2"
 
+    @property
+    def signer(self) -> LocalAccount:
+        """The eth-account signer for ``payer_private_key``, derived once."""
+        signer = getattr(self, "_signer", None)
+        if signer is None:
+            from eth_account import Account
+
+            signer = Account.from_key(self.payer_private_key)
+            object.__setattr__(self, "_signer", signer)
+        return signer
+
+    @property
+    def domain_separator(self) -> bytes:
+        """The EIP-712 domain separator of the asset contract, hashed once."""
+        separator = getattr(self, "_domain_separator", None)
+        if separator is None:
+            from eth_utils import keccak
+
+            separator = keccak(
+                _EIP712_DOMAIN_TYPEHASH
+                + keccak(text=self.token_name)
+                + keccak(text=self.token_version)
+                + self.chain_id.to_bytes(32, "big")
+                + _address_word(self.asset_address)
+            )
+            object.__setattr__(self, "_domain_separator", separator)
+        return separator
+
+    @property
+    def party_words(self) -> bytes:
+        """The payer and receiver addresses as two ABI-encoded words, encoded once."""
+        words = getattr(self, "_party_words", None)
+        if words is None:
+            words = _address_word(self.payer_address) + _address_word(
+                self.receiver_address
+            )
+            object.__setattr__(self, "_party_words", words)
+        return words
+
     @property
     def amount_base_units_str(self) -> str:
         return str(self.amount_base_units)
 
     def payment_requirements(self) -> Dict[str, Any]:
+        """
+        Return the ``paymentRequirements`` object for this configuration.
+
+        The values are computed once per configuration; each call returns a
+        fresh copy that the caller is free to modify.
+        """
+        requirements = getattr(self, "_requirements", None)
+        if requirements is None:
+            requirements = self._build_requirements()
+            object.__setattr__(self, "_requirements", requirements)
+        return {**requirements, "extra": dict(requirements["extra"])}
+
+    def _build_requirements(self) -> Dict[str, Any]:
         return {
             "scheme": "exact",
             "network": self.network,
@@ -192,15 +312,33 @@ class PaymentConfig:
 
     @classmethod
     def from_mapping(cls, values: Mapping[str, str]) -> "PaymentConfig":
+        """
+        Build a configuration from ``X402_*`` values.
+
+        Only the keys the configuration reads take part in the lookup, so
+        identical settings reuse the previously validated instance.
+        """
+        return _config_from_values(
+            cls._build, tuple(values.get(key) for key in _CONFIG_ENV_KEYS)
+        )
+
+    @classmethod
+    def _build(cls, values: Mapping[str, str]) -> "PaymentConfig":
         facilitator_url = values.get(
             "X402_FACILITATOR_URL", "https://api.x402.unibase.com"
         ).rstrip("/")
 
+        from eth_account import Account
+
         private_key = _normalize_private_key(values["X402_PAYER_PRIVATE_KEY"])
         payer_account = Account.from_key(private_key)
 
-        payer_address = values.get("X402_PAYER_ADDRESS", payer_account.address)
-        payer_address = _normalize_address(payer_address, "X402_PAYER_ADDRESS")
+        payer_raw = values.get("X402_PAYER_ADDRESS")
+        if payer_raw is None:
+            # eth-account already returns the checksummed form.
+            payer_address = payer_account.address
+        else:
+            payer_address = _normalize_address(payer_raw, "X402_PAYER_ADDRESS")
 
         receiver_raw = values.get("X402_RECEIVER_ADDRESS")
         if receiver_raw is None:
@@ -220,13 +358,11 @@ class PaymentConfig:
         max_timeout_seconds = int(values.get("X402_PAYMENT_TIMEOUT_SECONDS", "600"))
         backdate_seconds = int(values.get("X402_PAYMENT_BACKDATE_SECONDS", "600"))
 
-        asset_address = _normalize_address(
-            values.get(
-                "X402_PAYMENT_ASSET_ADDRESS",
-                "0xf3A3E4D9c163251124229Da6DC9C98D889647804",
-            ),
-            "X402_PAYMENT_ASSET_ADDRESS",
-        )
+        asset_raw = values.get("X402_PAYMENT_ASSET_ADDRESS")
+        if asset_raw is None:
+            asset_address = _DEFAULT_ASSET_ADDRESS
+        else:
+            asset_address = _normalize_address(asset_raw, "X402_PAYMENT_ASSET_ADDRESS")
 
         decimals = int(values.get("X402_PAYMENT_TOKEN_DECIMALS", "18"))
         amount_base_units = _to_base_units(amount_decimal, decimals)
@@ -245,7 +381,7 @@ class PaymentConfig:
         chain_id = int(values.get("X402_PAYMENT_CHAIN_ID", "56"))
         network = values.get("X402_PAYMENT_NETWORK", "bsc")
 
-        return cls(
+        config = cls(
             facilitator_url=facilitator_url,
             payer_private_key=private_key,
             payer_address=payer_address,
@@ -263,6 +399,8 @@ class PaymentConfig:
             token_name=token_name,
             token_version=token_version,
         )
+        object.__setattr__(config, "_signer", payer_account)
+        return config
 
     @classmethod
     def from_env(
@@ -310,15 +448,32 @@ class PaymentConfig:
                 "network": network,
             },
         )
+        if not overrides and not parameter_overrides and env_file is None:
+            # Nothing to layer on top of the base mapping, so read it in place.
+            return cls.from_mapping(base or os.environ)
+
         merged_overrides = dict(overrides or {})
         merged_overrides.update(parameter_overrides)
 
-        environment = build_environment(
-            env_file=env_file,
-            base=base,
-            overrides=merged_overrides,
+        # ``from_mapping`` reads a handful of keys once, so the sources are
+        # chained instead of copied into a merged environment.
+        return cls.from_mapping(
+            _chain_environment(env_file=env_file, base=base, overrides=merged_overrides)
         )
-        return cls.from_mapping(environment.variables)
+
+
+@functools.lru_cache(maxsize=32)
+def _config_from_values(
+    build: Callable[[Mapping[str, str]], PaymentConfig],
+    env_values: Tuple[Optional[str], ...],
+) -> PaymentConfig:
+    return build(
+        {
+            key: value
+            for key, value in zip(_CONFIG_ENV_KEYS, env_values)
+            if value is not None
+        }
+    )
 
 
 def load_payment_config(
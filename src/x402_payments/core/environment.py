@@ -9,12 +9,24 @@ fed into :class:`x402_payments.core.config.PaymentConfig`.
 from __future__ import annotations
 
 import os
+from collections import ChainMap
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Mapping, MutableMapping, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, MutableMapping, Optional, Tuple, cast
 
 
-def _parse_env_file(path: Path) -> Dict[str, str]:
+_EMPTY: Mapping[str, str] = MappingProxyType({})
+
+# Prefix shared by every variable :class:`PaymentConfig` reads.
+_ENV_PREFIX = "X402_"
+
+# Parsed .env files keyed by absolute path, alongside the (mtime_ns, size)
+# stamp they were read at.
+_ENV_CACHE: Dict[str, Tuple[Tuple[int, int], Mapping[str, str]]] = {}
+
+
+def _read_env_file(path: Path) -> Dict[str, str]:
     values: Dict[str, str] = {}
     try:
         data = path.read_text(encoding="utf-8")
@@ -23,13 +35,41 @@ def _parse_env_file(path: Path) -> Dict[str, str]:
 
     for raw_line in data.splitlines():
         line = raw_line.strip()
-        if not line or line.startswith("#") or "=" not in line:
+        if not line or line[0] == "#":
             continue
-        key, value = line.split("=", 1)
-        values[key.strip()] = value.strip()
+        key, sep, value = line.partition("=")
+        if sep:
+            values[key.strip()] = value.strip()
     return values
 
 
+def _parse_env_file(path: Path) -> Mapping[str, str]:
+    """
+    Return the parsed contents of ``path`` as a read-only mapping.
+
+    Results are reused until the file's modification time or size changes.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return _EMPTY
+
+    cache_key = os.path.abspath(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _ENV_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    values: Mapping[str, str] = MappingProxyType(_read_env_file(path))
+    _ENV_CACHE[cache_key] = (stamp, values)
+    return values
+
+
+def clear_env_cache() -> None:
+    """Drop all cached ``.env`` file contents."""
+    _ENV_CACHE.clear()
+
+
 def load_env_file(
     path: str = ".env",
     *,
@@ -71,14 +111,42 @@ def build_environment(
 
     ``base`` defaults to :data:`os.environ`. ``env_file`` is optional; set it to
     ``None`` to skip file loading entirely. ``overrides`` always win.
+
+    Only ``X402_*`` keys are taken from ``base`` and the ``.env`` file, as
+    nothing else is read by :class:`PaymentConfig`; this avoids copying the
+    whole process environment.
     """
-    merged: Dict[str, str] = dict(base or os.environ)
+    merged: Dict[str, str] = {
+        key: value
+        for key, value in (base or os.environ).items()
+        if key.startswith(_ENV_PREFIX)
+    }
 
     if env_file is not None:
         for key, value in _parse_env_file(Path(env_file)).items():
-            merged.setdefault(key, value)
+            if key.startswith(_ENV_PREFIX):
+                merged.setdefault(key, value)
 
     if overrides:
         merged.update(overrides)
 
     return PaymentEnvironment(variables=merged)
+
+
+def _chain_environment(
+    *,
+    env_file: Optional[str],
+    base: Optional[Mapping[str, str]],
+    overrides: Mapping[str, str],
+) -> Mapping[str, str]:
+    """
+    Layer the same sources as :func:`build_environment` without copying them.
+
+    Keys resolve through ``overrides``, then ``base``, then the ``.env`` file
+    when they are read, so the result reflects the sources at read time and
+    is meant to be consumed immediately.
+    """
+    file_values = _parse_env_file(Path(env_file)) if env_file is not None else _EMPTY
+    layers = (overrides, base or os.environ, file_values)
+    # ChainMap only writes to its first map, and the chain is never written to.
+    return ChainMap(*cast("Tuple[MutableMapping[str, str], ...]", layers))
@@ -4,22 +4,54 @@ Helpers for constructing the JSON payloads sent to the x402 facilitator.
 
 from __future__ import annotations
 
-import secrets
+import os
 import time
-from typing import Any, Dict, Optional
-
-from eth_account import Account
-from eth_account.messages import encode_typed_data
-from hexbytes import HexBytes
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
 
 from .config import PaymentConfig
 
+if TYPE_CHECKING:
+    from eth_typing import Hash32
+
 __all__ = [
     "build_authorization_payload",
     "build_payment_payload",
     "build_payment_request",
 ]
 
+# keccak256("TransferWithAuthorization(address from,address to,uint256 value,
+# uint256 validAfter,uint256 validBefore,bytes32 nonce)"). Every field is a
+# static 32-byte word, so the struct encoding is a plain concatenation.
+_TRANSFER_WITH_AUTHORIZATION_TYPEHASH = bytes.fromhex(
+    "7c7c6cdb67a18743f49ec6fa9b35f50d52ed05cbed4cc592e13b44501c1a2267"
+)
+
+# uint256 fields are sent as decimal strings because the facilitator may parse
+# JSON numbers as doubles. Flip this only for a facilitator known to accept
+# arbitrary-precision integers; ints then skip the ``str()`` round-trip.
+_JSON_BIGINT_SAFE = False
+
+_CLOCK_REFRESH_SECONDS = 0.25
+# (whole wall-clock second, monotonic time it was read at)
+_clock: Tuple[int, float] = (0, float("-inf"))
+
+
+def _current_timestamp() -> int:
+    """
+    Return the current Unix time in whole seconds.
+
+    The wall clock is re-read at most every ``_CLOCK_REFRESH_SECONDS``; the
+    authorization window is padded by minutes, so sub-second staleness does
+    not matter.
+    """
+    global _clock
+    wall, read_at = _clock
+    monotonic = time.monotonic()
+    if monotonic - read_at > _CLOCK_REFRESH_SECONDS:
+        wall = int(time.time())
+        _clock = (wall, monotonic)
+    return wall
+
 
 def build_authorization_payload(
     config: PaymentConfig,
@@ -30,60 +62,43 @@ def build_authorization_payload(
     """
     Construct and sign the ERC-3009 TransferWithAuthorization payload.
     """
-    now = int(time.time()) if now is None else now
-    nonce_bytes = nonce if nonce is not None else secrets.token_bytes(32)
+    now = _current_timestamp() if now is None else now
+    nonce_bytes = nonce if nonce is not None else os.urandom(32)
     valid_after = now - config.backdate_seconds
     valid_before = now + config.max_timeout_seconds
 
-    message = {
-        "from": config.payer_address,
-        "to": config.receiver_address,
-        "value": config.amount_base_units,
-        "validAfter": valid_after,
-        "validBefore": valid_before,
-        "nonce": HexBytes(nonce_bytes),
-    }
-    domain = {
-        "name": config.token_name,
-        "version": config.token_version,
-        "chainId": config.chain_id,
-        "verifyingContract": config.asset_address,
-    }
-    typed_data = {
-        "types": {
-            "EIP712Domain": [
-                {"name": "name", "type": "string"},
-                {"name": "version", "type": "string"},
-                {"name": "chainId", "type": "uint256"},
-                {"name": "verifyingContract", "type": "address"},
-            ],
-            "TransferWithAuthorization": [
-                {"name": "from", "type": "address"},
-                {"name": "to", "type": "address"},
-                {"name": "value", "type": "uint256"},
-                {"name": "validAfter", "type": "uint256"},
-                {"name": "validBefore", "type": "uint256"},
-                {"name": "nonce", "type": "bytes32"},
-            ],
-        },
-        "primaryType": "TransferWithAuthorization",
-        "domain": domain,
-        "message": message,
-    }
+    if len(nonce_bytes) != 32:
+        raise ValueError("nonce must be exactly 32 bytes")
+
+    from eth_utils import keccak
+
+    struct_hash = keccak(
+        _TRANSFER_WITH_AUTHORIZATION_TYPEHASH
+        + config.party_words
+        + config.amount_base_units.to_bytes(32, "big")
+        + valid_after.to_bytes(32, "big")
+        + valid_before.to_bytes(32, "big")
+        + nonce_bytes
+    )
+    digest = keccak(b"\x19\x01" + config.domain_separator + struct_hash)
+    signature = config.signer.unsafe_sign_hash(cast("Hash32", digest)).signature
 
-    account = Account.from_key(config.payer_private_key)
-    signable = encode_typed_data(full_message=typed_data)
-    signature = account.sign_message(signable).signature
+    if _JSON_BIGINT_SAFE:
+        value: int | str = config.amount_base_units
+        after: int | str = valid_after
+        before: int | str = valid_before
+    else:
+        value, after, before = config.amount_base_units_str, str(valid_after), str(valid_before)
 
     return {
-        "signature": "0x" + signature.hex(),
+        "signature": f"0x{signature.hex()}",
         "authorization": {
             "from": config.payer_address,
             "to": config.receiver_address,
-            "value": config.amount_base_units_str,
-            "validAfter": str(valid_after),
-            "validBefore": str(valid_before),
-            "nonce": "0x" + nonce_bytes.hex(),
+            "value": value,
+            "validAfter": after,
+            "validBefore": before,
+            "nonce": f"0x{nonce_bytes.hex()}",
         },
     }
 